@@ -1,7 +1,12 @@
-from .datatypes import Balance, Candlestick, Position, Rules, Symbol
-from .exceptions import ExchangeException
-from .exchanges import Binance
-from .interface import ExchangeInterface
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from .datatypes import Balance, Candlestick, Position, Rules, Symbol
+    from .exceptions import ExchangeException
+    from .exchanges import Binance
+    from .interface import ExchangeInterface
 
 
 __all__ = (
@@ -14,3 +19,29 @@ __all__ = (
     "Binance",
     "ExchangeInterface",
 )
+
+# Maps public names to their modules, which are imported on first access.
+_MODULE_MAP: dict[str, str] = {
+    "Balance": ".datatypes",
+    "Candlestick": ".datatypes",
+    "Position": ".datatypes",
+    "Rules": ".datatypes",
+    "Symbol": ".datatypes",
+    "ExchangeException": ".exceptions",
+    "Binance": ".exchanges",
+    "ExchangeInterface": ".interface",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _MODULE_MAP.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    # Lazy exports are not in the module globals until accessed.
+    return sorted({*globals(), *__all__})
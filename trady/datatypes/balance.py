@@ -3,7 +3,7 @@ from decimal import Decimal
 from pydantic import BaseModel
 
 
-class Balance(BaseModel):
+class Balance(BaseModel, defer_build=True):
     realized: Decimal
     unrealized: Decimal
 
@@ -4,7 +4,7 @@ from decimal import Decimal
 from pydantic import BaseModel
 
 
-class Candlestick(BaseModel):
+class Candlestick(BaseModel, frozen=True, defer_build=True):
     # Open/close datetime.
     open_datetime: datetime
     close_datetime: datetime
@@ -3,7 +3,7 @@ from decimal import Decimal
 from pydantic import BaseModel, PositiveInt
 
 
-class Position(BaseModel):
+class Position(BaseModel, defer_build=True):
     # Parameters.
     symbol_name: str
     size: Decimal
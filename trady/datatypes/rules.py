@@ -4,7 +4,7 @@ from typing import Optional
 from pydantic import BaseModel, PositiveInt
 
 
-class Rules(BaseModel):
+class Rules(BaseModel, frozen=True, defer_build=True):
     # Position size (absolute value).
     size_min_value: Optional[Decimal] = None
     size_max_value: Optional[Decimal] = None
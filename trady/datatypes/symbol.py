@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 
 
-class Symbol(BaseModel):
+class Symbol(BaseModel, frozen=True, defer_build=True):
     base_asset: str
     quote_asset: str
 
@@ -10,11 +10,7 @@ class Symbol(BaseModel):
         return self.base_asset + self.quote_asset
 
     def __eq__(self, other: object) -> bool:
-        match other:
-            case Symbol():
-                return self.name == other.name
-            case _:
-                return self.name == other
+        return self.name == (other.name if isinstance(other, Symbol) else other)
 
     def __hash__(self) -> int:
         return hash(self.name)
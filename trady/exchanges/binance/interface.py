@@ -6,21 +6,50 @@ API documentation:
     - https://developers.binance.com/docs/derivatives/usds-margined-futures/general-info
 """
 
+import hashlib
 import hmac
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
-from typing import Literal, Optional
+from functools import lru_cache
+from typing import Any, Literal, Optional
 from urllib.parse import urlencode
 
+import orjson
 from pydantic import PositiveInt
 
 from trady.datatypes import Balance, Candlestick, Position, Rules, Symbol
 from trady.exceptions import ExchangeException
-from trady.interface import ExchangeInterface
+from trady.interface import ExchangeInterface, _from_milliseconds, _to_milliseconds
 
 from .settings import BinanceSettings
 
 
+@lru_cache(maxsize=4096)
+def _parse_decimal(value: str, /) -> Decimal:
+    # Rules values (steps, tick sizes, limits) repeat across symbols, so their decimals are shared.
+    return Decimal(value)
+
+
+def _is_zero(value: str, /) -> bool:
+    # Only used as a filter predicate, avoid constructing a decimal.
+    return float(value) == 0
+
+
+@lru_cache(maxsize=1024)
+def _build_rules(decimal_items: frozenset[tuple[str, str]], leverage_max_value: int, /) -> Rules:
+    # Rules rarely change between polls, so each distinct set is built once.
+    # Decimals are keyed by their API strings, equal decimals (e.g. `0.1` and `0.10`) differ in precision.
+    # Rules values are trusted API data, skip validation.
+    rules_kwargs: dict = {field_name: _parse_decimal(value) for field_name, value in decimal_items}
+    return Rules.model_construct(**rules_kwargs, leverage_max_value=leverage_max_value)
+
+
+# Polling the latest candlesticks returns mostly the same timestamps, so conversions are cached.
+_parse_timestamp = lru_cache(maxsize=8192)(_from_milliseconds)
+
+
 class Binance(ExchangeInterface):
     # Maps intervals to the corresponding API values.
     _INTERVAL_MAP: dict[int, str] = {
@@ -37,36 +66,60 @@ class Binance(ExchangeInterface):
         60 * 60 * 12: "12h",
         60 * 60 * 24: "1d",
     }
+    # Maximum number of orders within a single batch API request.
+    _BATCH_ORDERS_MAX_NUMBER: int = 5
+    # Maps symbol filter types to the corresponding rules fields and their API keys.
+    _FILTER_MAP: dict[str, dict[str, str]] = {
+        "LOT_SIZE": {
+            "size_min_value": "minQty",
+            "size_max_value": "maxQty",
+            "size_step": "stepSize",
+        },
+        "MIN_NOTIONAL": {
+            "notional_min_value": "notional",
+        },
+        "PRICE_FILTER": {
+            "price_min_value": "minPrice",
+            "price_max_value": "maxPrice",
+            "price_step": "tickSize",
+        },
+    }
 
     @classmethod
     def _get_settings(cls) -> BinanceSettings:
         return BinanceSettings()
 
-    def __init__(self) -> None:
-        super().__init__()
+    def _initialize(self) -> None:
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/general-info#endpoint-security-type
         self._session.headers.update({"X-MBX-APIKEY": self._settings.api_key})  # type: ignore[attr-defined]
+        # Keyed HMAC state, copied for every signature to skip re-keying.
+        self._hmac: hmac.HMAC = hmac.new(
+            self._settings.api_secret.encode(),  # type: ignore[attr-defined]
+            digestmod=hashlib.sha256,
+        )
+        # Maps API paths to their last retrieved data and its monotonic timestamp.
+        self._api_cache: dict[str, tuple[float, Any]] = {}
+        # Maps symbol names to their last applied margin type and leverage, and its monotonic timestamp.
+        self._margin_state_map: dict[str, tuple[float, tuple[str, int]]] = {}
 
-    def _sign_request_data(self, data: dict, /) -> dict:
+    def _sign_request_data(self, data: dict, /) -> str:
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/general-info#signed-trade-and-user_data-endpoint-security
-        data["timestamp"] = int(datetime.now().timestamp() * 1000)
-        data["signature"] = hmac.new(
-            self._settings.api_secret.encode(),  # type: ignore[attr-defined]
-            msg=urlencode(data).encode(),
-            digestmod="SHA256",
-        ).hexdigest()
-        return data
+        data["timestamp"] = time.time_ns() // 1_000_000
+        # The signed query string is sent as is, so the data is only encoded once.
+        query_str = urlencode(data)
+        signature = self._hmac.copy()
+        signature.update(query_str.encode())
+        return f"{query_str}&signature={signature.hexdigest()}"
 
     def _get_datetime(self) -> datetime:
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/market-data/rest-api/Check-Server-Time
         response_data = self._dispatch_api_request("GET", "/v1/time")
-        timestamp = int(response_data["serverTime"]) / 1000  # type: ignore[call-overload]
-        return datetime.fromtimestamp(timestamp)
+        # Server time is unique on every call, convert it without polluting the timestamps cache.
+        return _from_milliseconds(response_data["serverTime"])  # type: ignore[call-overload]
 
     def _get_symbols(self) -> list[Symbol]:
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/market-data/rest-api/Exchange-Information
-        response_data = self._dispatch_api_request("GET", "/v1/exchangeInfo")
-        symbols_data = response_data["symbols"]  # type: ignore[call-overload]
+        symbols_data = self._get_cached_api_data("/v1/exchangeInfo")["symbols"]
         return [
             self._parse_symbol(symbol_data)
             for symbol_data in symbols_data
@@ -83,7 +136,8 @@ class Binance(ExchangeInterface):
         start_datetime: Optional[datetime] = None,
         end_datetime: Optional[datetime] = None,
     ) -> list[Candlestick]:
-        if interval not in self._INTERVAL_MAP:
+        api_interval = self._INTERVAL_MAP.get(interval)
+        if api_interval is None:
             raise ValueError(f"unknown interval {interval}")
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/market-data/rest-api/Kline-Candlestick-Data
         response_data = self._dispatch_api_request(
@@ -91,35 +145,36 @@ class Binance(ExchangeInterface):
             "/v1/klines",
             query_dict={
                 "symbol": symbol_name,
-                "interval": self._INTERVAL_MAP[interval],
+                "interval": api_interval,
                 "limit": number,
-                "startTime": int(start_datetime.timestamp() * 1000) if start_datetime else None,
-                "endTime": int(end_datetime.timestamp() * 1000) if end_datetime else None,
+                "startTime": _to_milliseconds(start_datetime) if start_datetime else None,
+                "endTime": _to_milliseconds(end_datetime) if end_datetime else None,
             },
         )
         return [self._parse_candlestick(candlestick_data) for candlestick_data in response_data]
 
     def _get_rules(self) -> dict[str, Rules]:
+        api_data_map = self._get_cached_api_data_map(
+            {
+                # https://developers.binance.com/docs/derivatives/usds-margined-futures/market-data/rest-api/Exchange-Information
+                "/v1/exchangeInfo": False,
+                # https://developers.binance.com/docs/derivatives/usds-margined-futures/account/rest-api/Notional-and-Leverage-Brackets
+                "/v1/leverageBracket": True,
+            },
+        )
+        symbols_data = api_data_map["/v1/exchangeInfo"]["symbols"]
+        response_data = api_data_map["/v1/leverageBracket"]
         # Maps symbol names to rules data.
         rules_data_map: dict[str, dict] = {}
-        # https://developers.binance.com/docs/derivatives/usds-margined-futures/market-data/rest-api/Exchange-Information
-        response_data = self._dispatch_api_request("GET", "/v1/exchangeInfo")
-        symbols_data = response_data["symbols"]  # type: ignore[call-overload]
         for symbol_data in symbols_data:
             symbol_name = symbol_data["symbol"]
             rules_data_map[symbol_name] = {"filters": symbol_data["filters"]}
-        # https://developers.binance.com/docs/derivatives/usds-margined-futures/account/rest-api/Notional-and-Leverage-Brackets
-        response_data = self._dispatch_api_request(
-            "GET",
-            "/v1/leverageBracket",
-            query_dict=self._sign_request_data({}),
-        )
         for symbol_data in response_data:
             symbol_name = symbol_data["symbol"]
             if symbol_name not in rules_data_map:
                 continue
             for bracket_data in symbol_data["brackets"]:
-                if int(bracket_data["bracket"]) == 1 or Decimal(bracket_data["notionalFloor"]) == 0:
+                if bracket_data["bracket"] == 1 or _is_zero(bracket_data["notionalFloor"]):
                     rules_data_map[symbol_name]["bracket"] = bracket_data
                     break
         return {symbol_name: self._parse_rules(rules_data) for symbol_name, rules_data in rules_data_map.items()}
@@ -129,7 +184,8 @@ class Binance(ExchangeInterface):
         response_data = self._dispatch_api_request(
             "GET",
             "/v3/balance",
-            query_dict=self._sign_request_data({}),
+            query_str=self._sign_request_data({}),
+            signed=True,
         )
         for balance_data in response_data:
             if balance_data["asset"] == asset:
@@ -141,12 +197,13 @@ class Binance(ExchangeInterface):
         response_data = self._dispatch_api_request(
             "GET",
             "/v2/positionRisk",
-            query_dict=self._sign_request_data({}),
+            query_str=self._sign_request_data({}),
+            signed=True,
         )
         return {
             position_data["symbol"]: self._parse_position(position_data)
             for position_data in response_data
-            if Decimal(position_data["positionAmt"]) != 0
+            if not _is_zero(position_data["positionAmt"])
         }
 
     def _open_position(
@@ -159,62 +216,66 @@ class Binance(ExchangeInterface):
         take_profit: Optional[Decimal] = None,
         stop_loss: Optional[Decimal] = None,
     ) -> Position:
-        self._set_margin_type(symbol_name, "CROSSED")
-        self._set_leverage(symbol_name, leverage)
+        # Margin type and leverage are only changed when they differ from the ones applied within the API cache TTL.
+        # They can be changed outside of this instance, so the applied ones expire like the cached API data.
+        margin_state = ("CROSSED", leverage)
+        now = time.monotonic()
+        cached = self._margin_state_map.get(symbol_name)
+        if cached is None or cached[1] != margin_state or now - cached[0] >= self._settings.api_cache_ttl:  # type: ignore[attr-defined]
+            self._set_margin_type(symbol_name, "CROSSED")
+            self._set_leverage(symbol_name, leverage)
+            self._margin_state_map[symbol_name] = (now, margin_state)
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/trade/rest-api
         open_side, close_side = ("BUY", "SELL") if size > 0 else ("SELL", "BUY")
         base_order = {
             "symbol": symbol_name,
             "positionSide": "BOTH",
             "newOrderRespType": "RESULT",
-            "recvWindow": 1000,
         }
-        self._dispatch_api_request(
-            "POST",
-            "/v1/order",
-            payload=self._sign_request_data(
+        try:
+            self._place_order(
                 {
                     **base_order,
                     "side": open_side,
                     "quantity": str(abs(size)),
                     "type": "MARKET",
                 },
-            ),
-        )
+            )
+        except ExchangeException:
+            # The order may have been rejected because of the margin state, apply it again next time.
+            self._margin_state_map.pop(symbol_name, None)
+            raise
+        # Batch items are not atomic, take profit and stop loss orders are only placed once the position is open.
+        close_orders = []
         if take_profit is not None:
-            self._dispatch_api_request(
-                "POST",
-                "/v1/order",
-                payload=self._sign_request_data(
-                    {
-                        **base_order,
-                        "side": close_side,
-                        "stopPrice": str(take_profit),
-                        "type": "TAKE_PROFIT_MARKET",
-                        "closePosition": "TRUE",
-                        "workingType": "CONTRACT_PRICE",
-                        "priceProtect": "FALSE",
-                        "timeInForce": "GTE_GTC",
-                    },
-                ),
+            close_orders.append(
+                {
+                    **base_order,
+                    "side": close_side,
+                    "stopPrice": str(take_profit),
+                    "type": "TAKE_PROFIT_MARKET",
+                    "closePosition": "TRUE",
+                    "workingType": "CONTRACT_PRICE",
+                    "priceProtect": "FALSE",
+                    "timeInForce": "GTE_GTC",
+                },
             )
         if stop_loss is not None:
-            self._dispatch_api_request(
-                "POST",
-                "/v1/order",
-                payload=self._sign_request_data(
-                    {
-                        **base_order,
-                        "side": close_side,
-                        "stopPrice": str(stop_loss),
-                        "type": "STOP_MARKET",
-                        "closePosition": "TRUE",
-                        "workingType": "CONTRACT_PRICE",
-                        "priceProtect": "FALSE",
-                        "timeInForce": "GTE_GTC",
-                    },
-                ),
+            close_orders.append(
+                {
+                    **base_order,
+                    "side": close_side,
+                    "stopPrice": str(stop_loss),
+                    "type": "STOP_MARKET",
+                    "closePosition": "TRUE",
+                    "workingType": "CONTRACT_PRICE",
+                    "priceProtect": "FALSE",
+                    "timeInForce": "GTE_GTC",
+                },
             )
+        if close_orders:
+            # Take profit and stop loss orders are placed within a single API request when both are set.
+            self._place_orders(close_orders)
         return Position(
             symbol_name=symbol_name,
             size=size,
@@ -223,32 +284,125 @@ class Binance(ExchangeInterface):
         )
 
     def _close_position(self, position: Position, /) -> None:
+        self._place_order(self._get_close_order(position))
+
+    def _close_positions(self, positions: list[Position], /) -> None:
+        orders = [self._get_close_order(position) for position in positions]
+        # Orders are placed in batches of the maximum size, a lone order goes through the single order API endpoint.
+        orders_batches = [
+            orders[index : index + self._BATCH_ORDERS_MAX_NUMBER]
+            for index in range(0, len(orders), self._BATCH_ORDERS_MAX_NUMBER)
+        ]
+        if not orders_batches:
+            return
+        if len(orders_batches) == 1:
+            self._place_orders(orders_batches[0])
+            return
+        # Batches are independent, dispatch the API requests concurrently.
+        with ThreadPoolExecutor(max_workers=min(len(orders_batches), self._settings.api_pool_size)) as executor:
+            list(executor.map(self._place_orders, orders_batches))
+
+    def _get_close_order(self, position: Position, /) -> dict:
+        return {
+            "symbol": position.symbol_name,
+            "side": "SELL" if position.is_long else "BUY",
+            "quantity": str(abs(position.size)),
+            "type": "MARKET",
+            "reduceOnly": "TRUE",
+            "positionSide": "BOTH",
+            "newOrderRespType": "RESULT",
+        }
+
+    def _place_order(self, order: dict, /) -> None:
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/trade/rest-api
         self._dispatch_api_request(
             "POST",
             "/v1/order",
-            payload=self._sign_request_data(
+            query_str=self._sign_request_data(
                 {
-                    "symbol": position.symbol_name,
-                    "side": "SELL" if position.is_long else "BUY",
-                    "quantity": str(abs(position.size)),
-                    "type": "MARKET",
-                    "reduceOnly": "TRUE",
-                    "positionSide": "BOTH",
-                    "newOrderRespType": "RESULT",
+                    **order,
                     "recvWindow": 1000,
                 },
             ),
+            signed=True,
         )
 
-    def _close_positions(self, positions: list[Position], /) -> None:
-        for position in positions:
-            self._close_position(position)
+    def _place_orders(self, orders: list[dict], /) -> None:
+        if len(orders) == 1:
+            # A single order weighs less through the single order API endpoint.
+            self._place_order(orders[0])
+            return
+        # https://developers.binance.com/docs/derivatives/usds-margined-futures/trade/rest-api/Place-Multiple-Orders
+        response_data = self._dispatch_api_request(
+            "POST",
+            "/v1/batchOrders",
+            query_str=self._sign_request_data(
+                {
+                    "batchOrders": orjson.dumps(orders).decode(),
+                    "recvWindow": 1000,
+                },
+            ),
+            signed=True,
+        )
+        # Rejected orders are reported individually within a successful response.
+        for order_data in response_data:
+            if "code" in order_data:
+                raise ExchangeException(
+                    f"API order returned {order_data['code']}",
+                    response_data=order_data,
+                )
+
+    def _warm_up_api_connection(self) -> None:
+        # https://developers.binance.com/docs/derivatives/usds-margined-futures/market-data/rest-api/Test-Connectivity
+        self._dispatch_api_request("GET", "/v1/ping")
+
+    def _clear_api_cache(self) -> None:
+        self._api_cache.clear()
+        self._margin_state_map.clear()
 
-    def _close_all_positions(self) -> None:
-        positions_map = self.get_positions()
-        positions = list(positions_map.values())
-        self._close_positions(positions)
+    def _warm_up_api_cache(self) -> None:
+        # Rules retrieve both exchange information and leverage brackets.
+        self._get_rules()
+
+    def _get_cached_api_data(self, path: str, /, *, signed: bool = False) -> Any:
+        return self._get_cached_api_data_map({path: signed})[path]
+
+    def _get_cached_api_data_map(self, signed_map: dict[str, bool], /) -> dict[str, Any]:
+        # Exchange information and leverage brackets are large and rarely change, reuse them within the configured TTL.
+        now = time.monotonic()
+        # Maps API paths to their data.
+        api_data_map: dict[str, Any] = {}
+        # Maps expired API paths to whether their requests are signed.
+        expired_signed_map: dict[str, bool] = {}
+        for path, signed in signed_map.items():
+            cached = self._api_cache.get(path)
+            if cached is not None and now - cached[0] < self._settings.api_cache_ttl:  # type: ignore[attr-defined]
+                api_data_map[path] = cached[1]
+            else:
+                expired_signed_map[path] = signed
+        if len(expired_signed_map) > 1:
+            # Expired API requests are independent, dispatch them concurrently.
+            with ThreadPoolExecutor(max_workers=len(expired_signed_map)) as executor:
+                futures = {
+                    path: executor.submit(self._retrieve_cached_api_data, path, signed)
+                    for path, signed in expired_signed_map.items()
+                }
+                api_data_map.update({path: future.result() for path, future in futures.items()})
+        else:
+            for path, signed in expired_signed_map.items():
+                api_data_map[path] = self._retrieve_cached_api_data(path, signed)
+        return api_data_map
+
+    def _retrieve_cached_api_data(self, path: str, signed: bool, /) -> Any:
+        timestamp = time.monotonic()
+        response_data = self._dispatch_api_request(
+            "GET",
+            path,
+            query_str=self._sign_request_data({}) if signed else None,
+            signed=signed,
+        )
+        self._api_cache[path] = (timestamp, response_data)
+        return response_data
 
     def _set_margin_type(
         self,
@@ -261,12 +415,13 @@ class Binance(ExchangeInterface):
             self._dispatch_api_request(
                 "POST",
                 "/v1/marginType",
-                payload=self._sign_request_data(
+                query_str=self._sign_request_data(
                     {
                         "symbol": symbol_name,
                         "marginType": margin_type,
                     },
                 ),
+                signed=True,
             )
         except ExchangeException as exception:
             # -4046 is returned when the same margin type is already set.
@@ -278,72 +433,67 @@ class Binance(ExchangeInterface):
         self._dispatch_api_request(
             "POST",
             "/v1/leverage",
-            payload=self._sign_request_data(
+            query_str=self._sign_request_data(
                 {
                     "symbol": symbol_name,
                     "leverage": leverage,
                 },
             ),
+            signed=True,
         )
 
     def _parse_symbol(self, symbol_data: dict, /) -> Symbol:
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/market-data/rest-api/Exchange-Information#response-example
-        return Symbol(
+        return Symbol.model_construct(
             base_asset=symbol_data["baseAsset"],
             quote_asset=symbol_data["quoteAsset"],
         )
 
     def _parse_candlestick(self, candlestick_data: list, /) -> Candlestick:
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/market-data/rest-api/Kline-Candlestick-Data#response-example
-        open_timestamp = int(candlestick_data[0]) / 1000
-        close_timestamp = int(candlestick_data[6]) / 1000
         volume = Decimal(candlestick_data[7])
         buy_volume = Decimal(candlestick_data[10])
         sell_volume = volume - buy_volume
-        return Candlestick(
-            open_datetime=datetime.fromtimestamp(open_timestamp),
-            close_datetime=datetime.fromtimestamp(close_timestamp),
-            open=candlestick_data[1],
-            high=candlestick_data[2],
-            low=candlestick_data[3],
-            close=candlestick_data[4],
+        # Klines are trusted API data, skip validation.
+        return Candlestick.model_construct(
+            open_datetime=_parse_timestamp(candlestick_data[0]),
+            close_datetime=_parse_timestamp(candlestick_data[6]),
+            open=Decimal(candlestick_data[1]),
+            high=Decimal(candlestick_data[2]),
+            low=Decimal(candlestick_data[3]),
+            close=Decimal(candlestick_data[4]),
             buy_volume=buy_volume,
             sell_volume=sell_volume,
         )
 
     def _parse_rules(self, rules_data: dict, /) -> Rules:
-        rules_kwargs = {}
+        # Maps rules fields to their API decimal strings.
+        decimal_map: dict[str, str] = {}
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/market-data/rest-api/Exchange-Information#response-example
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/common-definition#symbol-filters
         for filter_data in rules_data["filters"]:
-            match filter_data["filterType"]:
-                case "LOT_SIZE":
-                    rules_kwargs["size_min_value"] = filter_data["minQty"]
-                    rules_kwargs["size_max_value"] = filter_data["maxQty"]
-                    rules_kwargs["size_step"] = filter_data["stepSize"]
-                case "MIN_NOTIONAL":
-                    rules_kwargs["notional_min_value"] = filter_data["notional"]
-                case "PRICE_FILTER":
-                    rules_kwargs["price_min_value"] = filter_data["minPrice"]
-                    rules_kwargs["price_max_value"] = filter_data["maxPrice"]
-                    rules_kwargs["price_step"] = filter_data["tickSize"]
+            filter_fields = self._FILTER_MAP.get(filter_data["filterType"])
+            if filter_fields is None:
+                continue
+            for field_name, filter_key in filter_fields.items():
+                decimal_map[field_name] = filter_data[filter_key]
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/account/rest-api/Notional-and-Leverage-Brackets#response-example
-        rules_kwargs["notional_max_value"] = rules_data["bracket"]["notionalCap"]
-        rules_kwargs["leverage_max_value"] = rules_data["bracket"]["initialLeverage"]
-        return Rules(**rules_kwargs)
+        # Notional caps are JSON numbers, convert them through strings like pydantic does.
+        decimal_map["notional_max_value"] = str(rules_data["bracket"]["notionalCap"])
+        return _build_rules(frozenset(decimal_map.items()), int(rules_data["bracket"]["initialLeverage"]))
 
     def _parse_balance(self, balance_data: dict, /) -> Balance:
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/account/rest-api/Futures-Account-Balance-V3#response-example
-        return Balance(
-            realized=balance_data["crossWalletBalance"],
-            unrealized=balance_data["crossUnPnl"],
+        return Balance.model_construct(
+            realized=Decimal(balance_data["crossWalletBalance"]),
+            unrealized=Decimal(balance_data["crossUnPnl"]),
         )
 
     def _parse_position(self, position_data: dict, /) -> Position:
         # https://developers.binance.com/docs/derivatives/usds-margined-futures/trade/rest-api/Position-Information-V2#response-example
-        return Position(
+        return Position.model_construct(
             symbol_name=position_data["symbol"],
-            size=position_data["positionAmt"],
-            leverage=position_data["leverage"],
-            pnl=position_data["unRealizedProfit"],
+            size=Decimal(position_data["positionAmt"]),
+            leverage=int(position_data["leverage"]),
+            pnl=Decimal(position_data["unRealizedProfit"]),
         )
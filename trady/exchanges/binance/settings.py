@@ -6,7 +6,7 @@ API documentation:
     - https://developers.binance.com/docs/derivatives/usds-margined-futures/general-info
 """
 
-from pydantic import HttpUrl, NonNegativeFloat, PositiveInt
+from pydantic import HttpUrl, NonNegativeFloat, NonNegativeInt, PositiveFloat, PositiveInt
 
 from trady.settings import ExchangeSettings
 
@@ -14,8 +14,17 @@ from trady.settings import ExchangeSettings
 class BinanceSettings(ExchangeSettings, env_prefix="trady__binance__"):
     # Inherited settings.
     api_url: HttpUrl = HttpUrl("https://fapi.binance.com/fapi")
+    api_pool_size: PositiveInt = 10
+    api_timeout: PositiveFloat = 30
+    api_max_retries: NonNegativeInt = 3
+    api_connection_warm_up: bool = False
+    api_cache_warm_up: bool = False
     candlesticks_max_number: PositiveInt = 1500
-    candlesticks_iterator_throttle: NonNegativeFloat = 0.2
+    # Full klines requests weigh 10, 0.3 seconds between starts keeps iterators at 2000 of the 2400 weight per minute limit.
+    candlesticks_iterator_throttle: NonNegativeFloat = 0.3
+    candlesticks_iterator_max_workers: PositiveInt = 4
+    candlesticks_batch_max_workers: PositiveInt = 10
     # Implementation settings.
     api_key: str = ""
     api_secret: str = ""
+    api_cache_ttl: NonNegativeFloat = 60
@@ -1,19 +1,36 @@
 """Abstract exchange interface."""
 
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime
 from decimal import Decimal
-from typing import Iterator, Literal, Optional
+from typing import Callable, ClassVar, Iterator, Literal, Optional
 
+import orjson
 from pydantic import PositiveInt
-from requests import Session, status_codes
-from requests.exceptions import JSONDecodeError
+from requests import RequestException, Session, status_codes
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from .datatypes import Balance, Candlestick, Position, Rules, Symbol
 from .exceptions import ExchangeException
 from .settings import ExchangeSettings
 
 
+def _to_milliseconds(datetime_: datetime, /) -> int:
+    # Naive datetimes are local, `timestamp()` resolves DST transitions (including `fold`).
+    return int(datetime_.replace(microsecond=0).timestamp()) * 1000 + datetime_.microsecond // 1000
+
+
+def _from_milliseconds(timestamp: int, /) -> datetime:
+    # Milliseconds are split with integer math to avoid float rounding.
+    seconds, milliseconds = divmod(timestamp, 1000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=milliseconds * 1000)
+
+
 class ExchangeInterface:
     """Abstract exchange interface.
 
@@ -25,14 +42,43 @@ class ExchangeInterface:
     See `trady.exchanges.binance.interface`.
     """
 
+    # Maps interface classes to their shared HTTP adapters.
+    _adapter_map: ClassVar[dict[type["ExchangeInterface"], HTTPAdapter]] = {}
+
     @classmethod
     def _get_settings(cls) -> ExchangeSettings:
         """Override this to implement exchange settings."""
         raise NotImplementedError
 
+    def _initialize(self) -> None:
+        """Override this to initialize exchange state, it is called on construction before any API request."""
+
     def __init__(self) -> None:
         self._settings: ExchangeSettings = self._get_settings()
         self._session: Session = Session()
+        # Instances of the same interface share persistent connections, sessions only carry instance headers.
+        adapter = self._adapter_map.get(type(self))
+        if adapter is None:
+            adapter = self._adapter_map[type(self)] = self._build_adapter()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Avoid serializing `api_url` on every API request.
+        self._api_url: str = str(self._settings.api_url)
+        self._initialize()
+        if self._settings.api_connection_warm_up:
+            # Establish a connection in background, so the first API request does not wait for the handshakes.
+            threading.Thread(
+                target=self._warm_up_in_background,
+                args=(self._warm_up_api_connection,),
+                daemon=True,
+            ).start()
+        if self._settings.api_cache_warm_up:
+            # Fill the cache in background, so the first API requests relying on it do not wait for it.
+            threading.Thread(
+                target=self._warm_up_in_background,
+                args=(self._warm_up_api_cache,),
+                daemon=True,
+            ).start()
 
     def get_datetime(self) -> datetime:
         """Retrieve current datetime."""
@@ -91,7 +137,9 @@ class ExchangeInterface:
     ) -> Iterator[Candlestick]:
         """Retrieve all candlesticks for a given datetime period.
 
-        This method chains the underlying `get_candlesticks()` calls.
+        This method splits the period into windows of `_settings.candlesticks_max_number` candlesticks
+        and chains the underlying candlesticks API requests. Up to `_settings.candlesticks_iterator_max_workers`
+        windows are retrieved in background while the current one is being consumed.
 
         Parameters
         ----------
@@ -104,22 +152,99 @@ class ExchangeInterface:
         end_datetime
             A datetime to end with.
         """
-        while True:
-            candlesticks = self.get_candlesticks(
+        throttle = self._settings.candlesticks_iterator_throttle
+
+        def get_candlesticks(
+            window_start_datetime: datetime,
+            window_end_datetime: datetime,
+            not_before: float,
+        ) -> list[Candlestick]:
+            # Throttle relative to the previous request start, so slow responses are not delayed further.
+            time.sleep(max(0.0, not_before - time.monotonic()))
+            # The number is always the maximum one, skip the public method validation.
+            return self._get_candlesticks(
                 symbol_name,
                 interval,
                 number=self._settings.candlesticks_max_number,
-                start_datetime=start_datetime,
-                end_datetime=end_datetime,
+                start_datetime=window_start_datetime,
+                end_datetime=window_end_datetime,
             )
-            yield from candlesticks
-            if (
-                len(candlesticks) < self._settings.candlesticks_max_number
-                or candlesticks[-1].close_datetime >= end_datetime
-            ):
-                return
-            start_datetime = candlesticks[-1].close_datetime
-            time.sleep(self._settings.candlesticks_iterator_throttle)
+
+        # Windows are computed in epoch milliseconds, naive datetime arithmetic is wrong across DST transitions.
+        # Windows do not overlap, each candlestick belongs to the one containing its open datetime.
+        window = interval * self._settings.candlesticks_max_number * 1000
+        start_timestamp = _to_milliseconds(start_datetime)
+        windows_number = max(1, (_to_milliseconds(end_datetime) - start_timestamp) // window + 1)
+        window_datetimes = (
+            (
+                start_datetime if index == 0 else _from_milliseconds(start_timestamp + window * index),
+                # The last window ends with `end_datetime` inclusively.
+                end_datetime
+                if index == windows_number - 1
+                else _from_milliseconds(start_timestamp + window * (index + 1) - 1),
+            )
+            for index in range(windows_number)
+        )
+        max_workers = min(windows_number, self._settings.candlesticks_iterator_max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: deque[Future[list[Candlestick]]] = deque()
+            not_before = time.monotonic() - throttle
+            for window_start_datetime, window_end_datetime in window_datetimes:
+                # Each request starts no earlier than `throttle` after the previous one.
+                not_before = max(time.monotonic(), not_before + throttle)
+                futures.append(
+                    executor.submit(get_candlesticks, window_start_datetime, window_end_datetime, not_before),
+                )
+                if len(futures) == max_workers:
+                    yield from futures.popleft().result()
+            while futures:
+                yield from futures.popleft().result()
+
+    def get_candlesticks_batch(
+        self,
+        symbol_names: list[str],
+        interval: PositiveInt,
+        /,
+        *,
+        number: Optional[PositiveInt] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None,
+    ) -> dict[str, list[Candlestick]]:
+        """Retrieve candlesticks for multiple symbols.
+
+        This method dispatches the underlying `get_candlesticks()` calls concurrently,
+        using at most `_settings.candlesticks_batch_max_workers` threads.
+
+        Parameters
+        ----------
+        symbol_names
+            Candlesticks symbols.
+        interval
+            Candlesticks interval.
+        number
+            Required number of candlesticks (see `get_candlesticks()`).
+        start_datetime
+            A datetime to start with.
+        end_datetime
+            A datetime to end with.
+
+        Returns
+        -------
+        A mapping between symbol names and their candlesticks.
+        """
+        with ThreadPoolExecutor(max_workers=self._settings.candlesticks_batch_max_workers) as executor:
+            futures = {
+                symbol_name: executor.submit(
+                    self.get_candlesticks,
+                    symbol_name,
+                    interval,
+                    number=number,
+                    start_datetime=start_datetime,
+                    end_datetime=end_datetime,
+                )
+                for symbol_name in symbol_names
+            }
+            return {symbol_name: future.result() for symbol_name, future in futures.items()}
 
     def get_rules(self) -> dict[str, Rules]:
         """Retrieve trading rules.
@@ -206,6 +331,37 @@ class ExchangeInterface:
         """Close all positions."""
         self._close_all_positions()
 
+    def clear_api_cache(self) -> None:
+        """Discard cached API data, so it is retrieved again on the next use."""
+        self._clear_api_cache()
+
+    def warm_up_api_cache(self) -> None:
+        """Retrieve cacheable API data into the cache.
+
+        This method is called in background on construction when `_settings.api_cache_warm_up` is enabled.
+        """
+        self._warm_up_api_cache()
+
+    def _warm_up_in_background(self, warm_up: Callable[[], None], /) -> None:
+        # Failures are ignored, connections and data are retrieved again on the first use.
+        with suppress(ExchangeException, RequestException):
+            warm_up()
+
+    def _build_adapter(self) -> HTTPAdapter:
+        # Keep enough persistent connections for concurrent requests (see `get_candlesticks_batch()`).
+        # Transient server errors are retried for idempotent requests only, orders are never replayed.
+        # Rate limits (and their `Retry-After` header) are handled by `_dispatch_api_request()`, which knows signed requests.
+        return HTTPAdapter(
+            pool_maxsize=self._settings.api_pool_size,
+            max_retries=Retry(
+                total=self._settings.api_max_retries,
+                backoff_factor=0.1,
+                status_forcelist=(500, 502, 503, 504),
+                respect_retry_after_header=False,
+                raise_on_status=False,
+            ),
+        )
+
     def _dispatch_api_request(
         self,
         method: Literal["GET", "POST"],
@@ -215,26 +371,60 @@ class ExchangeInterface:
         query_str: Optional[str] = None,
         query_dict: Optional[dict] = None,
         payload: Optional[dict] = None,
+        signed: bool = False,
     ) -> dict | list:
-        url = str(self._settings.api_url) + path
+        url = self._api_url + path
         if query_str:
             url += "?" + query_str.lstrip("?")
-        match method:
-            case "GET":
-                response = self._session.get(url, params=query_dict)
-            case "POST":
-                response = self._session.post(url, params=query_dict, data=payload)
+        # Rate limited idempotent requests are retried after the `Retry-After` header delay.
+        # Signed requests are not, their timestamp could expire while waiting.
+        retries_number = self._settings.api_max_retries if method == "GET" and not signed else 0
+        while True:
+            response = self._session.request(
+                method,
+                url,
+                params=query_dict,
+                data=payload,
+                timeout=self._settings.api_timeout,
+            )
+            retry_after = response.headers.get("Retry-After")
+            if (
+                response.status_code != status_codes.codes.TOO_MANY_REQUESTS
+                or retry_after is None
+                or retries_number == 0
+            ):
+                break
+            retries_number -= 1
+            time.sleep(Retry().parse_retry_after(retry_after))
         if response.status_code != status_codes.codes.OK:
             try:
-                response_data = response.json()
-            except JSONDecodeError:
+                response_data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
                 response_data = None
             raise ExchangeException(
                 f"API request returned {response.status_code}",
                 status_code=response.status_code,
                 response_data=response_data,
             )
-        return response.json()  # type: ignore[no-any-return]
+        try:
+            return orjson.loads(response.content)  # type: ignore[no-any-return]
+        except orjson.JSONDecodeError:
+            raise ExchangeException(
+                "API request returned invalid JSON",
+                status_code=response.status_code,
+            ) from None
+
+    def _warm_up_api_connection(self) -> None:
+        # No connection is established unless overridden.
+        pass
+
+    def _clear_api_cache(self) -> None:
+        # No API data is cached unless overridden.
+        pass
+
+    def _warm_up_api_cache(self) -> None:
+        # No API data is cached unless overridden.
+        pass
 
     def _get_datetime(self) -> datetime:
         raise NotImplementedError
@@ -279,7 +469,10 @@ class ExchangeInterface:
         raise NotImplementedError
 
     def _close_positions(self, positions: list[Position], /) -> None:
-        raise NotImplementedError
+        # Override this when the exchange supports closing multiple positions within a single API request.
+        for position in positions:
+            self._close_position(position)
 
     def _close_all_positions(self) -> None:
-        raise NotImplementedError
+        positions_map = self.get_positions()
+        self._close_positions(list(positions_map.values()))
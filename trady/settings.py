@@ -1,12 +1,10 @@
 """Abstract exchange settings."""
 
-from typing import Self
+from pydantic import HttpUrl, NonNegativeFloat, NonNegativeInt, PositiveFloat, PositiveInt, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from pydantic import HttpUrl, NonNegativeFloat, PositiveInt, model_validator
-from pydantic_settings import BaseSettings
 
-
-class ExchangeSettings(BaseSettings, env_file=".env", env_prefix="trady__", extra="ignore"):
+class ExchangeSettings(BaseSettings):
     """Abstract exchange settings.
 
     Subclasses must provide a unique `env_prefix` value (e.g. `trady__binance__`).
@@ -15,23 +13,57 @@ class ExchangeSettings(BaseSettings, env_file=".env", env_prefix="trady__", extr
     ----------
     api_url
         Base API URL.
+    api_pool_size
+        Maximum number of persistent connections to the API host.
+    api_timeout
+        Maximum number of seconds to wait for connecting to the API host and for each response read.
+    api_max_retries
+        Maximum number of retries for idempotent API requests failing with a transient error
+        or a rate limit (honoring the `Retry-After` header).
+    api_connection_warm_up
+        Whether to establish a persistent connection to the API host in background on construction.
+    api_cache_warm_up
+        Whether to retrieve cacheable API data in background on construction (see `warm_up_api_cache()`).
     candlesticks_max_number
         Maximum number of candlesticks that can be retrieved in a single API request.
     candlesticks_iterator_throttle
-        A delay between the API requests when retrieving more candlesticks
+        A minimum delay between the API requests (start to start) when retrieving more candlesticks
         than `candlesticks_max_number`. It helps to prevent violating rate limits.
+    candlesticks_iterator_max_workers
+        Maximum number of concurrent API requests when retrieving more candlesticks than `candlesticks_max_number`.
+    candlesticks_batch_max_workers
+        Maximum number of concurrent API requests when retrieving candlesticks for multiple symbols.
 
     Examples
     --------
     See `trady.exchanges.binance.settings`.
     """
 
+    # Declared as a dict, type checkers reject a `frozen` class argument on subclasses of non-frozen `BaseSettings`.
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="trady__",
+        extra="ignore",
+        frozen=True,
+        defer_build=True,
+    )
+
     api_url: HttpUrl
+    api_pool_size: PositiveInt
+    api_timeout: PositiveFloat
+    api_max_retries: NonNegativeInt
+    api_connection_warm_up: bool
+    api_cache_warm_up: bool
     candlesticks_max_number: PositiveInt
     candlesticks_iterator_throttle: NonNegativeFloat
+    candlesticks_iterator_max_workers: PositiveInt
+    candlesticks_batch_max_workers: PositiveInt
 
-    @model_validator(mode="after")
-    def validate_settings(self) -> Self:
-        # Ensure that `api_url` has no trailing slash.
-        self.api_url = HttpUrl(str(self.api_url).rstrip("/"))
-        return self
+    @field_validator("api_url")
+    @classmethod
+    def validate_api_url(cls, api_url: HttpUrl) -> HttpUrl:
+        # Ensure that `api_url` has no trailing slash, parsing it again only when needed.
+        api_url_str = str(api_url)
+        if api_url_str.endswith("/"):
+            return HttpUrl(api_url_str.rstrip("/"))
+        return api_url